@@ -0,0 +1,8 @@
+"""
+sanduta-tools: scripturile de mentenanță ale proiectului într-un singur CLI.
+
+Fiecare subcomandă trăiește în propriul modul și este importată doar când
+este rulată, ca pornirea la rece să rămână ieftină (hooks, bucle în shell).
+"""
+
+__version__ = '0.1.0'
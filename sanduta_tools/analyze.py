@@ -0,0 +1,507 @@
+"""
+sanduta-tools analyze: analiză completă a componentelor duplicate/nefolosite
+și a asset-urilor statice duplicate din public/.
+"""
+import hashlib
+import os
+import re
+from collections import defaultdict
+
+from .common import (
+    CACHE_PATH, CACHE_VERSION, DELTA_PATH, NEXTJS_SPECIAL_FILES, REPORT_PATH,
+    find_ui_components, get_component_name, load_report, write_report,
+)
+
+# Dimensiunea blocurilor citite pentru hash-ul parțial (început + sfârșit)
+PARTIAL_BLOCK_SIZE = 4096
+# Dimensiunea chunk-urilor pentru hash-ul complet (streaming)
+FULL_HASH_CHUNK_SIZE = 1024 * 1024
+
+SOURCE_EXTENSIONS = ('.tsx', '.ts', '.jsx', '.js')
+# Fișierele în care se caută referințe la asset-uri din public/
+REFERENCE_EXTENSIONS = SOURCE_EXTENSIONS + ('.css', '.scss', '.json', '.md', '.mdx')
+COMPONENT_EXTENSIONS = ('.tsx', '.jsx')
+TEST_SUFFIXES = ('.test.tsx', '.spec.tsx', '.test.jsx', '.spec.jsx')
+
+# Marcaj în raport: --incremental compară doar cu rapoarte produse de analyze
+REPORT_GENERATOR = 'sanduta-tools analyze'
+REPORT_VERSION = 1
+
+def sorted_walk(top):
+    """os.walk în ordine alfabetică, independentă de sistemul de fișiere"""
+    for root, dirs, files in os.walk(top):
+        dirs.sort()
+        yield root, dirs, sorted(files)
+
+def find_source_files(src_dir='src', extensions=SOURCE_EXTENSIONS):
+    """Găsește toate fișierele sursă care pot importa componente"""
+    sources = []
+    for root, dirs, files in sorted_walk(src_dir):
+        for file in files:
+            if file.endswith(extensions):
+                sources.append(os.path.join(root, file))
+    return sources
+
+def is_source_path(filepath):
+    return filepath.endswith(SOURCE_EXTENSIONS)
+
+def is_component_path(filepath):
+    """Componentă React = .tsx/.jsx care nu e test"""
+    return filepath.endswith(COMPONENT_EXTENSIONS) and not filepath.endswith(TEST_SUFFIXES)
+
+def group_by_name(components):
+    """Grupează componentele după nume (ordinea din sorted_walk)"""
+    by_name = defaultdict(list)
+    for comp in components:
+        by_name[get_component_name(comp)].append(comp)
+    return by_name
+
+_import_patterns = {}
+
+def import_patterns(component_name):
+    """Patterns de import pentru o componentă (compilate o singură dată)"""
+    if component_name not in _import_patterns:
+        name = re.escape(component_name)
+        _import_patterns[component_name] = [
+            re.compile(rf'import\s+.*\b{name}\b.*from'),
+            re.compile(rf'import\s+\{{[^}}]*\b{name}\b[^}}]*\}}'),
+            re.compile(rf'from\s+[\'"].*{name}[\'"]'),
+        ]
+    return _import_patterns[component_name]
+
+def find_imported_names(content, names):
+    """Numele de componente importate de conținutul unui fișier"""
+    return [
+        name for name in names
+        if name in content and any(p.search(content) for p in import_patterns(name))
+    ]
+
+def blob_sha(filepath):
+    """SHA-ul de blob git al conținutului (același ca `git hash-object`)"""
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    return hashlib.sha1(b'blob %d\0' % len(data) + data).hexdigest()
+
+def git_lines(*args):
+    import subprocess
+    result = subprocess.run(['git', *args], capture_output=True)
+    if result.returncode != 0:
+        raise OSError(result.stderr.decode(errors='replace').strip())
+    return [line for line in result.stdout.decode('utf-8', errors='replace').split('\0') if line]
+
+def file_signatures(sources, src_dir='src'):
+    """Hash de conținut per fișier, independent de mtime (checkout-ul din CI le resetează).
+
+    Pentru fișierele urmărite și nemodificate SHA-ul vine din indexul git,
+    fără a citi fișierul; doar fișierele modificate/noi sunt hash-uite local.
+    """
+    indexed = {}
+    try:
+        # Reîmprospătează stat-urile ca `touch` să nu marcheze fișierele ca modificate
+        git_lines('update-index', '-q', '--refresh')
+        for line in git_lines('ls-files', '-s', '-z', '--', src_dir):
+            info, path = line.split('\t', 1)
+            indexed[path] = info.split()[1]
+        for path in git_lines('ls-files', '-m', '-z', '--', src_dir):
+            indexed.pop(path, None)
+    except OSError:
+        indexed = {}
+
+    signatures = {}
+    for path in sources:
+        sha = indexed.get(path.replace(os.sep, '/'))
+        if sha is None:
+            try:
+                sha = blob_sha(path)
+            except OSError:
+                sha = None
+        signatures[path] = sha
+    return signatures
+
+def read_source(filepath):
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception:
+        return None
+
+def scan_file(filepath, names, sha, urls):
+    """Rezultatul per fișier: e componentă exportată, ce componente importă și
+    ce asset-uri duplicate din public/ referă"""
+    record = {'sha': sha}
+    content = read_source(filepath)
+    if content is None:
+        record.update({'component': False, 'imports': [], 'assetRefs': []})
+        return record
+
+    # Caută export default sau export function/const
+    record['component'] = bool(re.search(r'export\s+(default|function|const)', content))
+    record['imports'] = find_imported_names(content, names) if is_source_path(filepath) else []
+    record['assetRefs'] = find_referenced_urls(content, urls)
+    return record
+
+def build_importers(files, records):
+    """Index invers: nume componentă -> fișierele care o importă"""
+    importers = defaultdict(list)
+    for path in files:
+        for name in records[path]['imports']:
+            importers[name].append(path)
+    return importers
+
+def build_asset_references(files, records):
+    """Index invers: URL asset -> fișierele care îl referă"""
+    references = defaultdict(list)
+    for path in files:
+        for url in records[path]['assetRefs']:
+            references[url].append(path)
+    return references
+
+def analyze_name(name, paths, ui_components, importers, records):
+    """Grupul de duplicate și componentele nefolosite pentru un singur nume"""
+    import_locations = importers.get(name, [])
+    import_count = len(import_locations)
+    group = None
+    deletable = set()
+
+    if len(paths) > 1:
+        # Are duplicate
+        standardized_path = ui_components.get(name, paths[0])
+        duplicate_entries = []
+
+        for path in paths:
+            if path == standardized_path:
+                continue
+
+            # Verifică dacă este într-adevăr o componentă
+            if not records[path]['component']:
+                continue
+
+            can_delete = import_count == 0
+            duplicate_entries.append({
+                'path': path,
+                'isUsed': import_count > 0,
+                'importCount': import_count,
+                'importLocations': import_locations[:5],  # Primele 5
+                'canDelete': can_delete,
+                'reason': 'Not imported anywhere' if can_delete else f'Used in {import_count} locations'
+            })
+            if can_delete:
+                deletable.add(path)
+
+        if duplicate_entries:
+            group = {
+                'componentName': name,
+                'standardizedPath': standardized_path if name in ui_components else None,
+                'duplicates': duplicate_entries
+            }
+
+    # Componente complet nefolosite (page.tsx, layout.tsx, etc sunt sărite)
+    unused = []
+    if name not in NEXTJS_SPECIAL_FILES and import_count == 0:
+        for path in paths:
+            if records[path]['component'] and path not in deletable:
+                unused.append({
+                    'path': path,
+                    'componentName': name,
+                    'reason': 'Not imported anywhere, likely obsolete'
+                })
+
+    return group, unused
+
+def collect_results(by_name, results):
+    """Grupuri și nefolosite în ordinea din by_name, ca rularea completă și cea
+    incrementală să producă același raport (listele sunt trunchiate)"""
+    groups = {}
+    unused = {}
+    for name in by_name:
+        group, unused_entries = results(name)
+        if group:
+            groups[name] = group
+        for entry in unused_entries:
+            unused[entry['path']] = entry
+    return groups, unused
+
+def build_report(groups, unused, total_components):
+    """Construiește raportul din grupuri (nume -> grup) și nefolosite (path -> intrare)"""
+    duplicates = list(groups.values())
+    unused_components = list(unused.values())
+
+    deletion_plan = [dup['path'] for d in duplicates for dup in d['duplicates'] if dup['canDelete']]
+    deletion_plan += [u['path'] for u in unused_components]
+
+    # Statistici
+    needs_refactoring = sum(1 for d in duplicates for dup in d['duplicates'] if not dup['canDelete'])
+
+    return {
+        'generatedBy': REPORT_GENERATOR,
+        'reportVersion': REPORT_VERSION,
+        'duplicates': duplicates,
+        'unusedComponents': unused_components[:50],  # Primele 50
+        'statistics': {
+            'totalDuplicates': len(duplicates),
+            'safeToDelete': len(deletion_plan),
+            'needsRefactoring': needs_refactoring,
+            'totalUnused': len(unused_components),
+            'totalComponents': total_components
+        },
+        'deletionPlan': deletion_plan[:30]  # Primele 30
+    }
+
+def find_all_assets(public_dir='public'):
+    """Găsește toate fișierele statice din public/ (inclusiv uploads)"""
+    assets = []
+    for root, dirs, files in sorted_walk(public_dir):
+        for file in files:
+            path = os.path.join(root, file)
+            if os.path.islink(path):
+                continue
+            assets.append(path)
+    return assets
+
+def partial_hash(filepath, size):
+    """Hash ieftin: doar primul și ultimul bloc din fișier"""
+    h = hashlib.sha1()
+    with open(filepath, 'rb') as f:
+        h.update(f.read(PARTIAL_BLOCK_SIZE))
+        if size > PARTIAL_BLOCK_SIZE:
+            f.seek(max(size - PARTIAL_BLOCK_SIZE, PARTIAL_BLOCK_SIZE))
+            h.update(f.read(PARTIAL_BLOCK_SIZE))
+    return h.hexdigest()
+
+def full_hash(filepath):
+    """Hash complet, citit în chunk-uri ca să nu încarce fișierul în memorie"""
+    h = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(FULL_HASH_CHUNK_SIZE), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def group_identical_files(paths):
+    """Grupează fișierele identice: mărime -> hash parțial -> hash complet.
+
+    Majoritatea fișierelor sunt eliminate după mărime sau hash parțial,
+    deci doar coliziunile reale sunt citite integral.
+    """
+    by_size = defaultdict(list)
+    for path in paths:
+        try:
+            by_size[os.path.getsize(path)].append(path)
+        except OSError:
+            pass
+
+    groups = []
+    for size, same_size in by_size.items():
+        if len(same_size) < 2 or size == 0:
+            continue
+
+        by_partial = defaultdict(list)
+        for path in same_size:
+            try:
+                by_partial[partial_hash(path, size)].append(path)
+            except OSError:
+                pass
+
+        for candidates in by_partial.values():
+            if len(candidates) < 2:
+                continue
+
+            # Fișierele mici sunt deja citite complet de hash-ul parțial
+            if size <= 2 * PARTIAL_BLOCK_SIZE:
+                try:
+                    groups.append((size, full_hash(candidates[0]), sorted(candidates)))
+                except OSError:
+                    pass
+                continue
+
+            by_full = defaultdict(list)
+            for path in candidates:
+                try:
+                    by_full[full_hash(path)].append(path)
+                except OSError:
+                    pass
+            for digest, identical in by_full.items():
+                if len(identical) > 1:
+                    groups.append((size, digest, sorted(identical)))
+
+    return groups
+
+def asset_public_url(filepath, public_dir='public'):
+    """Transformă public/images/logo.png în /images/logo.png"""
+    rel = os.path.relpath(filepath, public_dir).replace(os.sep, '/')
+    return '/' + rel
+
+def asset_reference_pattern(url):
+    """URL-ul ca referință întreagă: precedat de ghilimele, `(`, `=` sau spațiu și
+    neurmat de alte caractere de cale (`/logo.png` nu potrivește `/images/logo.png`)"""
+    return re.compile(r'(?<=[\'"`(=\s])' + re.escape(url) + r'(?![\w./-])')
+
+_asset_patterns = {}
+
+def find_referenced_urls(content, urls):
+    """URL-urile de asset-uri referite de conținutul unui fișier"""
+    found = []
+    for url in urls:
+        if url not in content:
+            continue
+        if url not in _asset_patterns:
+            _asset_patterns[url] = asset_reference_pattern(url)
+        if _asset_patterns[url].search(content):
+            found.append(url)
+    return found
+
+def find_asset_groups(public_dir='public'):
+    """Returnează (număr total de asset-uri, grupuri de fișiere identice)"""
+
+    print("🖼️  Analizez asset-urile statice...")
+
+    all_assets = find_all_assets(public_dir)
+    return len(all_assets), group_identical_files(all_assets)
+
+def asset_group_urls(groups, public_dir='public'):
+    return [asset_public_url(path, public_dir) for _, _, paths in groups for path in paths]
+
+def build_asset_section(total_assets, groups, references, public_dir='public'):
+    """Secțiunea de asset-uri duplicate din raport"""
+    asset_duplicates = []
+    wasted_bytes = 0
+    for size, digest, paths in sorted(groups, key=lambda g: (-g[0] * (len(g[2]) - 1), g[1])):
+        files = []
+        for path in paths:
+            url = asset_public_url(path, public_dir)
+            files.append({
+                'path': path,
+                'url': url,
+                'referencedBy': references.get(url, [])
+            })
+        wasted_bytes += size * (len(paths) - 1)
+        asset_duplicates.append({
+            'size': size,
+            'hash': digest,
+            'files': files
+        })
+
+    return {
+        'assetDuplicates': asset_duplicates,
+        'assetStatistics': {
+            'totalAssets': total_assets,
+            'duplicateGroups': len(asset_duplicates),
+            'duplicateFiles': sum(len(g['files']) - 1 for g in asset_duplicates),
+            'wastedBytes': wasted_bytes
+        }
+    }
+
+def analyze_duplicates():
+    """Analizează toate duplicatele.
+
+    Returnează (raport, stare); starea păstrează rezultatele per fișier și
+    grupurile complete, netrunchiate, pentru modul --incremental.
+    """
+    
+    print("🔍 Analizez componentele...")
+    
+    # UI standardizate (sursa de adevăr)
+    ui_components = find_ui_components()
+    
+    # Toate fișierele sursă și componentele dintre ele
+    files = find_source_files(extensions=REFERENCE_EXTENSIONS)
+    all_components = [path for path in files if is_component_path(path)]
+    by_name = group_by_name(all_components)
+    
+    # Asset-urile duplicate din public/ (după conținut)
+    total_assets, asset_groups = find_asset_groups()
+    urls = asset_group_urls(asset_groups)
+    
+    # Fiecare fișier e citit o singură dată (importuri + referințe la asset-uri)
+    names = list(by_name)
+    signatures = file_signatures(files)
+    records = {path: scan_file(path, names, signatures[path], urls) for path in files}
+    importers = build_importers(files, records)
+    
+    groups, unused = collect_results(
+        by_name, lambda name: analyze_name(name, by_name[name], ui_components, importers, records)
+    )
+    
+    report = build_report(groups, unused, len(all_components))
+    
+    # Duplicate de asset-uri statice (public/, inclusiv uploads)
+    assets = build_asset_section(total_assets, asset_groups, build_asset_references(files, records))
+    report.update(assets)
+    
+    state = {'version': CACHE_VERSION, 'files': records, 'duplicates': groups, 'unused': unused, 'assets': assets}
+    return report, state
+
+def run_incremental(update_baseline=False):
+    """Mod incremental: exit code 1 dacă apar duplicate noi față de rularea anterioară.
+
+    Când apar duplicate noi, raportul și cache-ul nu sunt actualizate, ca o
+    rulare repetată să compare tot cu ultima stare fără duplicate noi.
+    Cu update_baseline starea curentă e acceptată și salvată oricum.
+    """
+    from .incremental import analyze_incremental, full_delta, introduced_duplicates, is_valid_state
+
+    state = load_report(CACHE_PATH)
+
+    if is_valid_state(state):
+        report, state, delta = analyze_incremental(state)
+    else:
+        print("⚠️  Nu există cache de la rularea anterioară, rulez analiza completă")
+        report, state = analyze_duplicates()
+        delta = full_delta(load_report(REPORT_PATH), state)
+
+    write_report(delta, DELTA_PATH)
+    new_duplicates = introduced_duplicates(delta)
+
+    print("\n✅ Analiza incrementală completă!")
+    if delta['baseline']:
+        print(f"ℹ️  {REPORT_PATH} nu e produs de analyze; rularea curentă devine baseline-ul (fără diff)")
+    print(f"📊 Delta:")
+    print(f"   - Grupuri duplicate noi: {len(delta['duplicates']['added'])}")
+    print(f"   - Grupuri duplicate eliminate: {len(delta['duplicates']['removed'])}")
+    print(f"   - Grupuri duplicate modificate: {len(delta['duplicates']['changed'])}")
+    if delta['unused'] is not None:
+        print(f"   - Componente nefolosite noi: {len(delta['unused']['added'])}")
+        print(f"   - Componente nefolosite rezolvate: {len(delta['unused']['removed'])}")
+    print(f"   - Grupuri asset-uri duplicate noi: {len(delta['assets']['added'])}")
+    print(f"\n💾 Delta salvată în: {DELTA_PATH}")
+
+    if new_duplicates and not update_baseline:
+        print(f"❌ {new_duplicates} duplicate noi introduse (raportul și cache-ul nu au fost actualizate)")
+        return 1
+
+    write_report(report)
+    write_report(state, CACHE_PATH, indent=None)
+    if new_duplicates:
+        print(f"⚠️  {new_duplicates} duplicate noi acceptate în baseline (--update-baseline)")
+    return 0
+
+def main(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog='sanduta-tools analyze', description='Analiză completă a componentelor duplicate și nefolosite')
+    parser.add_argument('--incremental', action='store_true',
+                        help='recalculează doar ce au atins fișierele modificate și scrie delta față de rularea anterioară')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='cu --incremental: salvează starea curentă ca baseline chiar dacă apar duplicate noi')
+    args = parser.parse_args(argv)
+
+    if args.update_baseline and not args.incremental:
+        parser.error('--update-baseline se folosește doar cu --incremental')
+
+    if args.incremental:
+        return run_incremental(args.update_baseline)
+
+    report, state = analyze_duplicates()
+    
+    # Salvează raportul și cache-ul pentru --incremental
+    write_report(report)
+    write_report(state, CACHE_PATH, indent=None)
+    
+    print("\n✅ Analiza completă!")
+    print(f"📊 Statistici:")
+    print(f"   - Total componente: {report['statistics']['totalComponents']}")
+    print(f"   - Duplicate găsite: {report['statistics']['totalDuplicates']}")
+    print(f"   - Safe to delete: {report['statistics']['safeToDelete']}")
+    print(f"   - Needs refactoring: {report['statistics']['needsRefactoring']}")
+    print(f"   - Componente nefolosite: {report['statistics']['totalUnused']}")
+    print(f"   - Asset-uri duplicate: {report['assetStatistics']['duplicateFiles']} ({report['assetStatistics']['wastedBytes']} bytes irosiți)")
+    print(f"\n💾 Raport salvat în: {REPORT_PATH}")
+    return 0
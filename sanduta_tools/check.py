@@ -0,0 +1,86 @@
+"""
+sanduta-tools check: verifică bugetul de pornire la rece al CLI-ului.
+
+Rulează `python -X importtime -m sanduta_tools --version` și, pentru fiecare
+subcomandă, `python -X importtime -m sanduta_tools <cmd> --help` într-un
+proces nou și adună timpul propriu al fiecărui import. Eșuează dacă un total
+depășește bugetul sau dacă un modul greu ajunge să fie importat prea devreme.
+"""
+import os
+import subprocess
+import sys
+
+from .cli import COMMANDS
+
+DEFAULT_BUDGET_MS = 50.0
+# Module care nu trebuie încărcate la pornire (--version)
+LAZY_MODULES = ['json', 'subprocess', 'argparse', 'sanduta_tools.analyze', 'sanduta_tools.dupes', 'sanduta_tools.incremental']
+# Module care nu trebuie încărcate nici de `<cmd> --help` (doar când rulează efectiv)
+LAZY_COMMAND_MODULES = ['json', 'subprocess']
+RUNS = 5
+
+
+def measure_import_time(args):
+    """Returnează (total_ms, module_importate) pentru o pornire la rece cu argumentele date"""
+    package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-m', 'sanduta_tools', *args],
+        capture_output=True, text=True, cwd=package_root
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"`sanduta-tools {' '.join(args)}` nu pornește: {result.stderr.strip()[-500:]}")
+
+    total_us = 0
+    modules = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|', 2)
+        total_us += int(self_us)
+        modules.append(name.strip())
+
+    return total_us / 1000, modules
+
+
+def check_budget(label, args, lazy_modules, budget_ms):
+    """Verifică o invocare; returnează True dacă e în buget"""
+    # Minimul din câteva rulări, ca zgomotul mașinii să nu pice verificarea
+    samples = [measure_import_time(args) for _ in range(RUNS)]
+    total_ms = min(ms for ms, _ in samples)
+    modules = samples[0][1]
+
+    eager = [name for name in lazy_modules if name in modules]
+
+    status = '✅' if not eager and total_ms <= budget_ms else '❌'
+    print(f"{status} {label:<12} {total_ms:5.1f} ms")
+    for name in eager:
+        print(f"   ❌ Modul importat prea devreme, ar trebui să fie leneș: {name}")
+
+    return not eager and total_ms <= budget_ms
+
+
+def main(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog='sanduta-tools check', description='Verifică bugetul de pornire la rece al CLI-ului')
+    parser.add_argument('budget_ms', nargs='?', type=float, default=DEFAULT_BUDGET_MS,
+                        help=f'bugetul per invocare, în ms (implicit {DEFAULT_BUDGET_MS:.0f})')
+    budget_ms = parser.parse_args(argv).budget_ms
+
+    print(f"⏱️  Import la pornire (buget {budget_ms:.0f} ms):")
+    try:
+        ok = check_budget('--version', ['--version'], LAZY_MODULES, budget_ms)
+        for command in COMMANDS:
+            # check însuși folosește subprocess pentru măsurare
+            lazy_modules = [] if command == 'check' else LAZY_COMMAND_MODULES
+            ok = check_budget(command, [command, '--help'], lazy_modules, budget_ms) and ok
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    if not ok:
+        print("❌ Bugetul de pornire la rece a fost depășit")
+        return 1
+
+    print("✅ Pornire la rece în buget")
+    return 0
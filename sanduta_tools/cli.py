@@ -0,0 +1,50 @@
+"""
+Punctul de intrare `sanduta-tools <subcomandă> [argumente]`.
+
+Nu folosește argparse la nivel de top: alegem modulul după primul argument,
+îl importăm leneș și îi pasăm restul argumentelor.
+"""
+import sys
+
+from . import __version__
+
+# subcomandă -> (modul, descriere scurtă)
+COMMANDS = {
+    'analyze': ('analyze', 'Analiză completă a componentelor duplicate și nefolosite'),
+    'dupes': ('dupes', 'Analiză rapidă a componentelor duplicate'),
+    'fix-barrels': ('fix_barrels', 'Înlocuiește importurile din @/components/ui cu importuri directe'),
+    'fix-params': ('fix_params', 'Migrează params la Promise în route handlers (Next.js 15+)'),
+    'fix-unused': ('fix_unused', 'Prefixează cu underscore variabilele neutilizate'),
+    'check': ('check', 'Verifică bugetul de pornire la rece al CLI-ului'),
+}
+
+
+def print_usage(out=sys.stdout):
+    print("Usage: sanduta-tools <command> [args...]", file=out)
+    print("", file=out)
+    print("Commands:", file=out)
+    for name, (_, description) in COMMANDS.items():
+        print(f"  {name:<12} {description}", file=out)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if not argv or argv[0] in ('-h', '--help', 'help'):
+        print_usage()
+        return 0
+
+    if argv[0] == '--version':
+        print(__version__)
+        return 0
+
+    command = argv[0]
+    if command not in COMMANDS:
+        print(f"Unknown command: {command}", file=sys.stderr)
+        print_usage(sys.stderr)
+        return 2
+
+    from importlib import import_module
+    module = import_module(f'.{COMMANDS[command][0]}', __package__)
+    return module.main(argv[1:]) or 0
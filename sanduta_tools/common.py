@@ -0,0 +1,48 @@
+"""Helperi comuni pentru subcomenzile de analiză."""
+import os
+
+REPORT_PATH = 'RAPORT_E1_DUPLICATE_COMPONENTS.json'
+# Raportul rapid (dupes) are altă schemă, deci nu suprascrie raportul complet
+DUPES_REPORT_PATH = 'RAPORT_E1_DUPLICATE_COMPONENTS_FAST.json'
+# Diferențele față de rularea anterioară (analyze --incremental)
+DELTA_PATH = 'RAPORT_E1_DUPLICATE_COMPONENTS.delta.json'
+# Rezultatele per fișier din ultima rulare, refolosite de analyze --incremental
+CACHE_PATH = '.sanduta-tools-cache.json'
+CACHE_VERSION = 3
+UI_DIR = 'src/components/ui'
+
+# Fișiere speciale Next.js care au același nume în fiecare rută
+NEXTJS_SPECIAL_FILES = ['page', 'layout', 'loading', 'error', 'not-found']
+
+
+def get_component_name(filepath):
+    """Extrage numele componentei din filepath"""
+    return os.path.basename(filepath).replace('.tsx', '').replace('.jsx', '')
+
+
+def find_ui_components(ui_dir=UI_DIR):
+    """Componentele UI standardizate (sursa de adevăr)"""
+    ui_components = {}
+    if os.path.exists(ui_dir):
+        for file in os.listdir(ui_dir):
+            if file.endswith('.tsx'):
+                name = file.replace('.tsx', '')
+                ui_components[name] = os.path.join(ui_dir, file)
+    return ui_components
+
+
+def write_report(report, path=REPORT_PATH, indent=2):
+    """Salvează raportul JSON (json e importat doar aici)"""
+    import json
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=indent, ensure_ascii=False)
+
+
+def load_report(path=REPORT_PATH):
+    """Încarcă un raport JSON; None dacă lipsește sau e corupt"""
+    import json
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
@@ -0,0 +1,88 @@
+"""
+sanduta-tools fix-unused: fixarea variabilelor neutilizate
+Prefixează cu underscore variabilele neutilizate dar necesare (parametri de funcții)
+"""
+import re
+from pathlib import Path
+
+def fix_unused_req_params(file_path):
+    """Fix unused 'req' parameters in API routes"""
+    content = Path(file_path).read_text()
+    original = content
+    
+    # Pattern: export async function GET(req: NextRequest)
+    # Replace with: export async function GET(_req: NextRequest)
+    patterns = [
+        (r'\bfunction\s+GET\(req:', 'function GET(_req:'),
+        (r'\bfunction\s+POST\(req:', 'function POST(_req:'),
+        (r'\bfunction\s+PUT\(req:', 'function PUT(_req:'),
+        (r'\bfunction\s+PATCH\(req:', 'function PATCH(_req:'),
+        (r'\bfunction\s+DELETE\(req:', 'function DELETE(_req:'),
+    ]
+    
+    for pattern, replacement in patterns:
+        content = re.sub(pattern, replacement, content)
+    
+    if content != original:
+        Path(file_path).write_text(content)
+        return True
+    return False
+
+def fix_unused_request_params(file_path):
+    """Fix unused 'request' parameters"""
+    content = Path(file_path).read_text()
+    original = content
+    
+    # Similar patterns for 'request'
+    patterns = [
+        (r'\bfunction\s+GET\(request:', 'function GET(_request:'),
+        (r'\bfunction\s+POST\(request:', 'function POST(_request:'),
+        (r'\bfunction\s+PUT\(request:', 'function PUT(_request:'),
+        (r'\bfunction\s+PATCH\(request:', 'function PATCH(_request:'),
+        (r'\bfunction\s+DELETE\(request:', 'function DELETE(_request:'),
+    ]
+    
+    for pattern, replacement in patterns:
+        content = re.sub(pattern, replacement, content)
+    
+    if content != original:
+        Path(file_path).write_text(content)
+        return True
+    return False
+
+def fix_unused_error_vars(file_path):
+    """Fix unused error variables in catch blocks"""
+    content = Path(file_path).read_text()
+    original = content
+    
+    # catch (error) -> catch (_error)
+    # But only if error is truly unused (no references)
+    content = re.sub(r'catch\s*\(\s*error\s*\)', 'catch (_error)', content)
+    
+    if content != original:
+        Path(file_path).write_text(content)
+        return True
+    return False
+
+FIXERS = {
+    'req': fix_unused_req_params,
+    'request': fix_unused_request_params,
+    'error': fix_unused_error_vars,
+}
+
+def main(argv):
+    import argparse
+    parser = argparse.ArgumentParser(prog='sanduta-tools fix-unused', description='Prefixează cu underscore variabilele neutilizate')
+    parser.add_argument('fix_type', choices=list(FIXERS), help='req | request | error')
+    parser.add_argument('file_path')
+    args = parser.parse_args(argv)
+    
+    file_path = args.file_path
+    fixed = FIXERS[args.fix_type](file_path)
+    
+    if fixed:
+        print(f"Fixed {file_path}")
+    else:
+        print(f"No changes needed for {file_path}")
+    
+    return 0
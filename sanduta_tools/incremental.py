@@ -0,0 +1,260 @@
+"""
+sanduta-tools analyze --incremental: recalculează doar ce au atins fișierele modificate.
+
+Pornește de la rezultatele per fișier salvate de rularea anterioară
+(CACHE_PATH), cheiate pe SHA-ul de blob git al conținutului, și recitește doar
+fișierele al căror conținut s-a schimbat. Sunt recalculate doar grupurile de
+duplicate și intrările nefolosite ale componentelor afectate; restul sunt
+preluate din cache. Grupurile de asset-uri din public/ sunt recalculate la
+fiecare rulare (gruparea după mărime face ca doar coliziunile să fie citite),
+dar referințele din src/ vin tot din rezultatele per fișier.
+"""
+from .analyze import (
+    REFERENCE_EXTENSIONS, REPORT_GENERATOR, REPORT_VERSION,
+    analyze_name, asset_group_urls, build_asset_references, build_asset_section, build_importers,
+    build_report, collect_results, file_signatures, find_asset_groups, find_imported_names,
+    find_referenced_urls, find_source_files, group_by_name, is_component_path, is_source_path,
+    read_source, scan_file,
+)
+from .common import CACHE_VERSION, NEXTJS_SPECIAL_FILES, find_ui_components, get_component_name
+
+# Câmpurile unei intrări duplicate urmărite în delta
+TRACKED_FIELDS = ('importCount', 'canDelete')
+
+
+def is_valid_state(state):
+    return (
+        isinstance(state, dict)
+        and state.get('version') == CACHE_VERSION
+        and all(key in state for key in ('files', 'duplicates', 'unused', 'assets'))
+    )
+
+
+def state_urls(state):
+    """URL-urile asset-urilor duplicate căutate la rularea anterioară"""
+    return {f['url'] for group in state['assets']['assetDuplicates'] for f in group['files']}
+
+
+def update_records(files, names, urls, old_files, old_urls):
+    """Actualizează rezultatele per fișier; returnează (records, nume afectate, fișiere schimbate).
+
+    Un nume de componentă e afectat dacă fișierul componentei s-a schimbat
+    sau dacă un fișier modificat a început/încetat să-l importe. Numele noi
+    (componente adăugate) și URL-urile noi (asset-uri devenite duplicate)
+    trebuie căutate și în fișierele nemodificate.
+    """
+    current_names = set(names)
+    old_names = {get_component_name(path) for path in old_files if is_component_path(path)}
+    new_names = [name for name in names if name not in old_names]
+    affected = set(new_names) | (old_names - current_names)
+    current_urls = set(urls)
+    new_urls = [url for url in urls if url not in old_urls]
+    signatures = file_signatures(files)
+
+    records = {}
+    changed = []
+    for path in files:
+        old = old_files.get(path)
+        sha = signatures[path]
+
+        if old and sha is not None and old['sha'] == sha:
+            record = dict(old)
+            # Importurile componentelor șterse și asset-urile care nu mai sunt duplicate dispar
+            record['imports'] = [name for name in old['imports'] if name in current_names]
+            record['assetRefs'] = [url for url in old['assetRefs'] if url in current_urls]
+            search_names = new_names if is_source_path(path) else []
+            if search_names or new_urls:
+                content = read_source(path)
+                if content is not None:
+                    record['imports'] += find_imported_names(content, search_names)
+                    record['assetRefs'] += find_referenced_urls(content, new_urls)
+            affected.update(set(record['imports']) ^ set(old['imports']))
+        else:
+            record = scan_file(path, names, sha, urls)
+            changed.append(path)
+            affected.update(record['imports'])
+            if old:
+                affected.update(old['imports'])
+            if is_component_path(path):
+                affected.add(get_component_name(path))
+
+        records[path] = record
+
+    # Fișiere șterse
+    for path, old in old_files.items():
+        if path not in records:
+            changed.append(path)
+            affected.update(old['imports'])
+            if is_component_path(path):
+                affected.add(get_component_name(path))
+
+    return records, affected, changed
+
+
+def diff_entries(old_entries, new_entries):
+    """Intrările (aceeași cale) la care s-a schimbat importCount/canDelete"""
+    old_by_path = {entry['path']: entry for entry in old_entries}
+    changes = []
+    for entry in new_entries:
+        old = old_by_path.get(entry['path'])
+        if old is None:
+            continue
+        fields = [field for field in TRACKED_FIELDS if field in old and field in entry]
+        if any(old[field] != entry[field] for field in fields):
+            changes.append({
+                'path': entry['path'],
+                'before': {field: old[field] for field in fields},
+                'after': {field: entry[field] for field in fields}
+            })
+    return changes
+
+
+def diff_groups(old_groups, new_groups, names):
+    """Delta compactă pentru grupurile de duplicate ale numelor date"""
+    added, removed, changed = [], [], []
+    for name in sorted(names):
+        old, new = old_groups.get(name), new_groups.get(name)
+        if old is None and new is None:
+            continue
+        if old is None:
+            added.append({
+                'componentName': name,
+                'paths': [dup['path'] for dup in new['duplicates']]
+            })
+        elif new is None:
+            removed.append(name)
+        else:
+            old_paths = {dup['path'] for dup in old['duplicates']}
+            new_paths = {dup['path'] for dup in new['duplicates']}
+            entries = diff_entries(old['duplicates'], new['duplicates'])
+            if old_paths != new_paths or entries:
+                changed.append({
+                    'componentName': name,
+                    'addedPaths': sorted(new_paths - old_paths),
+                    'removedPaths': sorted(old_paths - new_paths),
+                    'changedEntries': entries
+                })
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def diff_unused(old_unused, new_unused):
+    return {
+        'added': sorted(set(new_unused) - set(old_unused)),
+        'removed': sorted(set(old_unused) - set(new_unused))
+    }
+
+
+def diff_assets(old_assets, new_assets):
+    """Delta pentru grupurile de asset-uri duplicate (cheiate pe hash-ul conținutului)"""
+    old_groups = {g['hash']: g for g in (old_assets or {}).get('assetDuplicates', [])}
+    new_groups = {g['hash']: g for g in new_assets['assetDuplicates']}
+    added, removed, changed = [], [], []
+    for digest in sorted(set(old_groups) | set(new_groups)):
+        old, new = old_groups.get(digest), new_groups.get(digest)
+        if old is None:
+            added.append({'hash': digest, 'paths': [f['path'] for f in new['files']]})
+        elif new is None:
+            removed.append(digest)
+        else:
+            old_paths = {f['path'] for f in old['files']}
+            new_paths = {f['path'] for f in new['files']}
+            if old_paths != new_paths:
+                changed.append({
+                    'hash': digest,
+                    'addedPaths': sorted(new_paths - old_paths),
+                    'removedPaths': sorted(old_paths - new_paths)
+                })
+    return {'added': added, 'removed': removed, 'changed': changed}
+
+
+def analyze_incremental(state):
+    """Returnează (raport, stare nouă, delta) față de starea anterioară"""
+
+    print("🔍 Analizez componentele (incremental)...")
+
+    ui_components = find_ui_components()
+    files = find_source_files(extensions=REFERENCE_EXTENSIONS)
+    all_components = [path for path in files if is_component_path(path)]
+    by_name = group_by_name(all_components)
+
+    total_assets, asset_groups = find_asset_groups()
+    urls = asset_group_urls(asset_groups)
+
+    records, affected, changed = update_records(files, list(by_name), urls, state['files'], state_urls(state))
+    importers = build_importers(files, records)
+
+    print(f"✅ {len(changed)} fișiere modificate, {len(affected)} componente afectate")
+
+    def results(name):
+        # Doar numele afectate sunt recalculate; restul vin din cache
+        if name in affected:
+            return analyze_name(name, by_name[name], ui_components, importers, records)
+        cached_unused = [state['unused'][path] for path in by_name[name] if path in state['unused']]
+        return state['duplicates'].get(name), cached_unused
+
+    groups, unused = collect_results(by_name, results)
+
+    assets = build_asset_section(total_assets, asset_groups, build_asset_references(files, records))
+
+    report = build_report(groups, unused, len(all_components))
+    report.update(assets)
+
+    affected_unused_old = {path for path, entry in state['unused'].items() if entry['componentName'] in affected}
+    affected_unused_new = {path for path, entry in unused.items() if entry['componentName'] in affected}
+
+    delta = {
+        'baseline': False,
+        'changedFiles': sorted(changed),
+        'duplicates': diff_groups(state['duplicates'], groups, affected),
+        'unused': diff_unused(affected_unused_old, affected_unused_new),
+        'assets': diff_assets(state['assets'], assets)
+    }
+
+    new_state = {'version': CACHE_VERSION, 'files': records, 'duplicates': groups, 'unused': unused, 'assets': assets}
+    return report, new_state, delta
+
+
+def is_analyze_report(report):
+    """Raportul a fost produs de aceeași versiune de analyze (nu de dupes / o schemă veche)?"""
+    return (
+        isinstance(report, dict)
+        and report.get('generatedBy') == REPORT_GENERATOR
+        and report.get('reportVersion') == REPORT_VERSION
+    )
+
+
+def full_delta(previous_report, state):
+    """Delta față de raportul anterior, când nu există cache (prima rulare).
+
+    Raportul salvat are listele de nefolosite trunchiate, deci aici se compară
+    doar duplicatele (componente și asset-uri). Dacă raportul anterior nu e
+    produs de analyze, rularea curentă devine baseline-ul, fără diff.
+    """
+    if not is_analyze_report(previous_report):
+        empty = {'added': [], 'removed': [], 'changed': []}
+        return {'baseline': True, 'changedFiles': None, 'duplicates': empty, 'unused': None, 'assets': empty}
+
+    old_groups = {g['componentName']: g for g in previous_report.get('duplicates', [])}
+    return {
+        'baseline': False,
+        'changedFiles': None,
+        'duplicates': diff_groups(old_groups, state['duplicates'], set(old_groups) | set(state['duplicates'])),
+        'unused': None,
+        'assets': diff_assets(previous_report, state['assets'])
+    }
+
+
+def introduced_duplicates(delta):
+    """Numărul de duplicate noi: căi noi în grupuri de componente și copii noi de asset-uri.
+
+    Fișierele speciale Next.js (page, layout, ...) au același nume în fiecare
+    rută, deci o rută nouă nu e un duplicat.
+    """
+    duplicates = delta['duplicates']
+    assets = delta['assets']
+    return (
+        sum(len(group['paths']) for group in duplicates['added'] if group['componentName'] not in NEXTJS_SPECIAL_FILES)
+        + sum(len(group['addedPaths']) for group in duplicates['changed'] if group['componentName'] not in NEXTJS_SPECIAL_FILES)
+        + sum(len(group['paths']) - 1 for group in assets['added'])
+        + sum(len(group['addedPaths']) for group in assets['changed'])
+    )